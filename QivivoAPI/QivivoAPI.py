@@ -1,6 +1,7 @@
 import sys
 from .qdevices import *
 from .habitation import *
+from .sync import *
 import urllib.request
 import urllib.parse
 import urllib.error
@@ -202,8 +203,9 @@ class API:
         try:
             info = json.load(urllib.request.urlopen(req))
         except urllib.error.HTTPError as e:
-            logging.error("QivivoAPI: urllib error: " + e.reason)
-            logging.error("QivivoAPI; API error: " + e.read())
+            logging.error("QivivoAPI: urllib error: " + str(e.reason))
+            logging.error("QivivoAPI; API error: " + str(e.read()))
+            raise
         return info
 
     def set_value(self, device_type: str, sub_type: str, uuid: str, value: str, data: json) -> {}:
@@ -227,12 +229,13 @@ class API:
                                      headers={'Content-Type': 'application/json',
                                               'Authorization': 'Bearer ' + self.token},
                                      method='POST',
-                                     data=json.dumps(data))
+                                     data=json.dumps(data).encode('utf-8'))
         try:
             info = json.load(urllib.request.urlopen(req))
         except urllib.error.HTTPError as e:
-            logging.error("QivivoAPI: urllib error: " + e.reason)
-            logging.error("QivivoAPI; API error: " + e.read())
+            logging.error("QivivoAPI: urllib error: " + str(e.reason))
+            logging.error("QivivoAPI; API error: " + str(e.read()))
+            raise
         return info
 
     def del_value(self, device_type: str, sub_type: str, uuid: str, value: str) -> {}:
@@ -258,8 +261,9 @@ class API:
         try:
             info = json.load(urllib.request.urlopen(req))
         except urllib.error.HTTPError as e:
-            logging.error("QivivoAPI: urllib error: " + e.reason)
-            logging.error("QivivoAPI; API error: " + e.read())
+            logging.error("QivivoAPI: urllib error: " + str(e.reason))
+            logging.error("QivivoAPI; API error: " + str(e.read()))
+            raise
         return info
 
     def put_value(self, device_type: str, sub_type: str, uuid: str, value: str, data: str) -> {}:
@@ -283,11 +287,12 @@ class API:
                                      headers={'Content-Type': 'application/json',
                                               'Authorization': 'Bearer ' + self.token},
                                      method='PUT',
-                                     data=json.dumps(data))
+                                     data=json.dumps(data).encode('utf-8'))
         try:
             info = json.load(urllib.request.urlopen(req))
         except urllib.error.HTTPError as e:
-            logging.error("QivivoAPI: urllib error: " + e.reason)
+            logging.error("QivivoAPI: urllib error: " + str(e.reason))
             logging.error("QivivoAPI; API error: " + str(e.read()))
+            raise
 
         return info
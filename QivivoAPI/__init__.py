@@ -1,4 +1,4 @@
 from .QivivoAPI import *
 
 
-__all__ = ["qdevices", "programs", "habitation"]
\ No newline at end of file
+__all__ = ["qdevices", "programs", "habitation", "sync"]
\ No newline at end of file
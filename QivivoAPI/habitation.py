@@ -52,10 +52,27 @@ class Habitation:
         self.get_settings()
         return info
 
-    def put_alert(self, value):
+    def put_settings(self, settings, refresh=True):
+        """
+        Define several temperature settings with a single call
+        :param settings: dict of setting -> value
+        :param refresh: read the settings back from the server after the update
+        :return:
+        """
+        logging.info("QivivoAPI: putting settings")
+        self.settings = dict(self.settings, **settings)
+        payload = dict(self.settings)
+        payload.pop('days_of_absence_before_alert', None)
+        info = self.api.put_value(self.api_type, 'settings', None, 'define_temperature', payload)
+        if refresh:
+            self.get_settings()
+        return info
+
+    def put_alert(self, value, refresh=True):
         payload={'new_nb_day':value}
         info = self.api.put_value(self.api_type, 'settings', None, 'define_temperature', payload)
-        self.get_settings()
+        if refresh:
+            self.get_settings()
         return info
 
 
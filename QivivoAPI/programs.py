@@ -20,6 +20,7 @@ class Program:
                'sunday': []}
 
     def __init__(self):
+        self.program = {day: [] for day in Program.program}
         return
 
 
@@ -0,0 +1,155 @@
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from .programs import Program, Period
+from .habitation import Habitation
+
+
+class RateLimiter:
+    """
+    Thread safe limiter spacing the calls made to Qivivo resources server
+
+    Attributes:
+    interval : float
+        minimal number of seconds between two calls
+    last_call : float
+        monotonic time of the last call allowed
+
+    Methods:
+    wait()
+        block until a new call is allowed
+    """
+    interval: float = 0.0
+    last_call: float = None
+
+    def __init__(self, calls_per_second=5):
+        if calls_per_second:
+            self.interval = 1.0 / calls_per_second
+        self.lock = threading.Lock()
+        return
+
+    def wait(self):
+        with self.lock:
+            now = time.monotonic()
+            if self.last_call is not None:
+                delay = self.last_call + self.interval - now
+                if delay > 0:
+                    time.sleep(delay)
+                    now = time.monotonic()
+            self.last_call = now
+
+
+class BulkSync:
+    """
+    Push a program or a settings document to many thermostats or habitations at once.
+    Current values are read once per target and only the differences are sent,
+    targets are processed concurrently while every read and put is rate limited.
+
+    Attributes:
+    max_workers : int
+        number of targets processed at the same time
+    limiter : RateLimiter
+        limiter shared by all the calls of the sync
+
+    Methods:
+    sync_program(thermostats, program_id, program, clear_empty_days=False)
+        update the days of the program that differ on each thermostat
+    sync_settings(habitations, settings)
+        update the settings that differ on each habitation
+    """
+    max_workers: int = 8
+    limiter: RateLimiter = None
+
+    def __init__(self, max_workers=8, calls_per_second=5):
+        self.max_workers = max_workers
+        self.limiter = RateLimiter(calls_per_second)
+        return
+
+    def sync_program(self, thermostats, program_id, program, clear_empty_days=False) -> []:
+        """
+        Update program_id on every thermostat with the days of program that differ.
+        Days without periods are left untouched on the devices unless clear_empty_days is set
+        :param thermostats: list of Thermostat
+        :param program_id: str
+        :param program: Program or dict of day -> list of Period or period dicts
+        :param clear_empty_days: bool, send the days without periods to clear them
+        :return: one report per thermostat
+        """
+        if isinstance(program, Program):
+            program = program.program
+        program = {day: [self._period(period) for period in periods] for day, periods in program.items()
+                   if periods or clear_empty_days}
+        logging.info('QivivoAPI: syncing program ' + str(program_id) + ' on ' + str(len(thermostats)) + ' thermostats')
+        return self._run(thermostats, lambda therm, changes: self._sync_program(therm, program_id, program, changes))
+
+    def sync_settings(self, habitations, settings) -> []:
+        """
+        Update every habitation with the settings that differ, unknown settings are rejected
+        :param habitations: list of Habitation
+        :param settings: dict of setting -> value
+        :return: one report per habitation
+        """
+        logging.info('QivivoAPI: syncing settings on ' + str(len(habitations)) + ' habitations')
+        return self._run(habitations, lambda hab, changes: self._sync_settings(hab, settings, changes))
+
+    def _run(self, targets, task) -> []:
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(executor.map(lambda target: self._report(target, task), targets))
+
+    @staticmethod
+    def _period(period) -> {}:
+        if isinstance(period, Period):
+            return {'period_start': period.period_start,
+                    'period_end': period.period_end,
+                    'temperature_setting': period.temperature_setting}
+        return period
+
+    @staticmethod
+    def _report(target, task) -> {}:
+        """
+        Run task on target, the task appends to changes after each successful put
+        so a failure partway through still reports what was applied
+        """
+        report = {'target': target, 'status': 'unchanged', 'changes': [], 'error': None}
+        try:
+            task(target, report['changes'])
+            if report['changes']:
+                report['status'] = 'updated'
+        except Exception as e:
+            logging.error('QivivoAPI: sync failed for ' + str(getattr(target, 'uuid', target)) + ': ' + str(e))
+            report['status'] = 'partial' if report['changes'] else 'error'
+            report['error'] = e
+        return report
+
+    def _sync_program(self, thermostat, program_id, program, changes) -> None:
+        self.limiter.wait()
+        current = None
+        for user_program in thermostat.get_programs().get('user_programs', []):
+            if str(user_program.get('id')) == str(program_id):
+                current = user_program.get('program') or {}
+        if current is None:
+            raise ValueError('program ' + str(program_id) + ' not found')
+        for day, periods in program.items():
+            if current.get(day) != periods:
+                self.limiter.wait()
+                thermostat.update_program(str(program_id), day, periods)
+                changes.append(day)
+
+    def _sync_settings(self, habitation, settings, changes) -> None:
+        self.limiter.wait()
+        current = habitation.get_settings()
+        unknown = [setting for setting in settings if setting not in Habitation.settings and setting not in current]
+        if unknown:
+            raise ValueError('unknown settings ' + ', '.join(unknown))
+        temperatures = {setting: value for setting, value in settings.items()
+                        if setting != 'days_of_absence_before_alert' and current.get(setting) != value}
+        if temperatures:
+            self.limiter.wait()
+            habitation.put_settings(temperatures, refresh=False)
+            changes.extend(temperatures)
+        alert = settings.get('days_of_absence_before_alert')
+        if 'days_of_absence_before_alert' in settings and current.get('days_of_absence_before_alert') != alert:
+            self.limiter.wait()
+            habitation.put_alert(alert, refresh=False)
+            changes.append('days_of_absence_before_alert')